@@ -0,0 +1,7 @@
+from pathlib import Path
+
+# Alert beep: alert.mp3 next to this file is written at build time by
+# fetch_alert_audio.py; the remote asset is only used when it is missing.
+# Kept free of third-party imports so the build step stays lightweight.
+ALERT_AUDIO_URL = "https://assets.mixkit.co/active_storage/sfx/2869/2869-preview.mp3"
+ALERT_AUDIO_PATH = Path(__file__).with_name("alert.mp3")
@@ -1,11 +1,13 @@
 import streamlit as st
-import plotly.graph_objects as go
-import pandas as pd
-import numpy as np
+
+from bms_core import init_session, compute_degradation, render_gauge, render_decay, render_heatmap
 
 # Page Config for a "Professional Dashboard" look
 st.set_page_config(page_title="UPS Battery AI Command", layout="wide")
 
+# --- SESSION STATE ---
+block_variance = init_session()
+
 st.title("🔋 AI Predictive Battery Command Center")
 st.markdown("---")
 
@@ -16,8 +18,7 @@ time_projection = st.sidebar.slider("Project forward (year)", 1, 9, 1)
 replacement_cost = st.sidebar.number_input("Cost per block (Rs)", value=500)
 
 # --- CALCULATIONS (The "AI" Logic) ---
-# High temp accelerates degradation exponentially
-degradation_factor = 1.2 ** (temp_input - 25)
+degradation_factor = compute_degradation(temp_input)
 current_health = 100 - (time_projection * 8 * degradation_factor)
 current_health = max(0, min(100, current_health))
 
@@ -42,51 +43,12 @@ col_left, col_right = st.columns([1, 2])
 
 with col_left:
     st.write("### Failure Probability")
-    fig_gauge = go.Figure(go.Indicator(
-        mode = "gauge+number",
-        value = 100 - current_health,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': "Risk Level %"},
-        gauge = {
-            'axis': {'range': [0, 100]},
-            'bar': {'color': "black"},
-            'steps' : [
-                {'range': [0, 50], 'color': "green"},
-                {'range': [50, 80], 'color': "orange"},
-                {'range': [80, 100], 'color': "red"}],
-        }
-    ))
-    st.plotly_chart(fig_gauge, use_container_width=True)
+    render_gauge(100 - current_health)
 
 with col_right:
     st.write("### Predicted Life Decay")
-    # Simulate a decay curve
-    months = np.arange(0, 25)
-    health_curve = 100 - (months * 2 * degradation_factor)
-    
-    fig_line = go.Figure()
-    fig_line.add_trace(go.Scatter(x=months, y=health_curve, mode='lines+markers', name='Health', line=dict(color='red' if current_health < 50 else 'green')))
-    fig_line.add_hline(y=50, line_dash="dash", line_color="red", annotation_text="FAILURE THRESHOLD")
-    fig_line.update_layout(xaxis_title="Months from Today", yaxis_title="Health %", yaxis_range=[0,110])
-    st.plotly_chart(fig_line, use_container_width=True)
+    render_decay(degradation_factor, 'red' if current_health < 50 else 'green')
 
 # --- ROW 3: INTERACTIVE HEATMAP ---
 st.write("### String Physical Layout Status")
-# Reshaping 30 blocks into 6x5
-grid_health = []
-for i in range(30):
-    # Add some randomness to make it look real
-    individual_variance = np.random.uniform(0.8, 1.2)
-    block_health = 100 - (time_projection * 8 * degradation_factor * individual_variance)
-    grid_health.append(max(0, block_health))
-
-grid_data = np.array(grid_health).reshape(6, 5)
-
-fig_heat = go.Figure(data=go.Heatmap(
-    z=grid_data,
-    x=[f"Col {i}" for i in range(1,6)],
-    y=[f"Row {i}" for i in range(1,7)],
-    colorscale='RdYlGn',
-    zmin=0, zmax=100
-))
-st.plotly_chart(fig_heat, use_container_width=True)
\ No newline at end of file
+render_heatmap(time_projection, degradation_factor, block_variance)
\ No newline at end of file
@@ -0,0 +1,178 @@
+import base64
+import sys
+
+import streamlit as st
+import plotly.graph_objects as go
+import plotly.io as pio
+import numpy as np
+from numba import njit
+
+from alert_audio import ALERT_AUDIO_URL, ALERT_AUDIO_PATH
+
+# Shared model + figure code for app.py and editapp.py. Imported once per
+# process, so the Numba kernel compiles once and the caches below are shared
+# by both pages and every session.
+
+# Serialize figures with the compiled orjson encoder
+pio.json.config.default_engine = "orjson"
+
+# Heatmap display resolution (rows, cols); longer strings are binned into it
+_GRID_SHAPE = (6, 5)
+
+# Axis values that never change between reruns
+_MONTHS = np.arange(25)
+_COL_LABELS = tuple(sys.intern(f"Col {i}") for i in range(1,6))
+_ROW_LABELS = tuple(sys.intern(f"Row {i}") for i in range(1,7))
+
+# High temp accelerates degradation exponentially; one entry per degree of
+# the 20-40 °C temperature slider
+_DEG_LUT_MIN, _DEG_LUT_MAX = 20, 40
+_DEG_LUT = np.array([1.2 ** (t - 25) for t in range(_DEG_LUT_MIN, _DEG_LUT_MAX + 1)])
+
+# --- SESSION STATE ---
+def init_session():
+    # One Generator per session; the per-block variance is drawn once from it
+    # so the heatmap stays stable when unrelated widgets change
+    if 'rng' not in st.session_state:
+        st.session_state['rng'] = np.random.default_rng(42)
+    if 'block_variance' not in st.session_state:
+        # Add some randomness to make it look real
+        st.session_state['block_variance'] = st.session_state['rng'].uniform(0.8, 1.2, 30)
+    return st.session_state['block_variance']
+
+# --- CACHED MODEL FUNCTIONS ---
+@st.cache_data(max_entries=64)
+def compute_degradation(temp):
+    if _DEG_LUT_MIN <= temp <= _DEG_LUT_MAX and temp == int(temp):
+        return float(_DEG_LUT[int(temp) - _DEG_LUT_MIN])
+    # Outside the table (or fractional): compute directly
+    return 1.2 ** (temp - 25)
+
+@st.cache_data(max_entries=64)
+def compute_health_curve(deg):
+    # Single allocation: scale into a new buffer, then subtract in place
+    health_curve = np.multiply(_MONTHS, 2 * deg)
+    np.subtract(100, health_curve, out=health_curve)
+    return health_curve
+
+# Serial on purpose: it runs on Streamlit's per-session script threads, and
+# a parallel kernel there hangs at exit under TBB (and the workqueue layer
+# isn't safe for concurrent launches)
+@njit(fastmath=True)
+def _grid_kernel(time_proj, deg, variance, out):
+    # Per-block health; scales to long strings of blocks
+    for i in range(variance.size):
+        out[i] = 100.0 - time_proj * 8.0 * deg * variance[i]
+
+def _bin_blocks(health):
+    # Fit the string into the fixed display grid so the heatmap payload stays
+    # the same size however many blocks there are: short strings are padded
+    # with NaN (empty cells), long ones are mean-binned
+    tiles = _GRID_SHAPE[0] * _GRID_SHAPE[1]
+    if health.size < tiles:
+        padded = np.full(tiles, np.nan)
+        padded[:health.size] = health
+        return padded.reshape(_GRID_SHAPE)
+    if health.size == tiles:
+        return health.reshape(_GRID_SHAPE)
+    edges = np.linspace(0, health.size, tiles + 1).astype(np.intp)
+    binned = np.add.reduceat(health, edges[:-1]) / np.diff(edges)
+    return binned.reshape(_GRID_SHAPE)
+
+@st.cache_data(max_entries=64)
+def compute_grid_health(time_projection, deg, variance):
+    out = np.empty(variance.size)
+    _grid_kernel(time_projection, deg, variance, out)
+    np.clip(out, 0, 100, out=out)
+    # Reshaping 30 blocks into 6x5 (padded or mean-binned otherwise)
+    return _bin_blocks(out)
+
+# --- FIGURE SKELETONS ---
+# Layout that never changes is built once per process. Traces are built as
+# plain dicts so each skeleton is validated in one pass; the data fields are
+# left empty and filled in by the render functions below.
+@st.cache_resource
+def gauge_skeleton():
+    return go.Figure(data=[dict(
+        type = "indicator",
+        mode = "gauge+number",
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Risk Level %"},
+        gauge = {
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "black"},
+            'steps' : [
+                {'range': [0, 50], 'color': "green"},
+                {'range': [50, 80], 'color': "orange"},
+                {'range': [80, 100], 'color': "red"}],
+        }
+    )])
+
+@st.cache_resource
+def decay_skeleton():
+    return go.Figure(
+        data=[dict(type='scattergl', x=_MONTHS.tolist(), mode='lines+markers', name='Health')],
+        layout=dict(
+            xaxis=dict(title=dict(text="Months from Today")),
+            yaxis=dict(title=dict(text="Health %"), range=[0,110]),
+            # Failure threshold line (equivalent of add_hline)
+            shapes=[dict(type='line', xref='x domain', x0=0, x1=1, yref='y', y0=50, y1=50, line=dict(color="red", dash="dash"))],
+            annotations=[dict(text="FAILURE THRESHOLD", showarrow=False, xref='x domain', x=1, xanchor='right', yref='y', y=50, yanchor='bottom')],
+        ),
+    )
+
+@st.cache_resource
+def heatmap_skeleton():
+    return go.Figure(data=[dict(
+        type='heatmap',
+        x=_COL_LABELS,
+        y=_ROW_LABELS,
+        colorscale='RdYlGn',
+        zmin=0, zmax=100
+    )])
+
+def _session_figure(name, skeleton):
+    # Each session patches its own copy, so concurrent sessions never write
+    # to the shared skeleton
+    if name not in st.session_state:
+        st.session_state[name] = go.Figure(skeleton())
+    return st.session_state[name]
+
+# --- RENDERERS ---
+# All inputs are sidebar widgets, which always rerun the whole script, so
+# the charts aren't fragments; only the data fields of each figure are
+# reassigned on a rerun.
+def render_gauge(risk):
+    fig = _session_figure('fig_gauge', gauge_skeleton)
+    fig.data[0].value = risk
+    st.plotly_chart(fig, key='gauge', width='stretch')
+
+def render_decay(deg, color):
+    # Simulate a decay curve
+    health_curve = compute_health_curve(deg)
+    fig = _session_figure('fig_decay', decay_skeleton)
+    fig.data[0].y = health_curve
+    fig.data[0].line.color = color
+    st.plotly_chart(fig, key='decay', width='stretch')
+
+def render_heatmap(time_projection, deg, variance):
+    fig = _session_figure('fig_heat', heatmap_skeleton)
+    # float32 halves the base64 typed-array payload sent to the browser
+    fig.data[0].z = compute_grid_health(time_projection, deg, variance).astype(np.float32)
+    st.plotly_chart(fig, key='heatmap', width='stretch')
+
+# --- ALERT AUDIO ---
+@st.cache_resource
+def _alert_audio_src():
+    # Embedded once per process as a data: URI so each CRITICAL transition
+    # plays without another download. Raises OSError if the file is missing;
+    # exceptions aren't cached, so the fallback below is never memoized
+    data = ALERT_AUDIO_PATH.read_bytes()
+    return "data:audio/mp3;base64," + base64.b64encode(data).decode("ascii")
+
+def load_alert_audio():
+    try:
+        src = _alert_audio_src()
+    except OSError:
+        src = ALERT_AUDIO_URL
+    return f'<audio autoplay><source src="{src}" type="audio/mp3"></audio>'
@@ -0,0 +1,20 @@
+import shutil
+import sys
+import urllib.request
+
+from alert_audio import ALERT_AUDIO_URL, ALERT_AUDIO_PATH
+
+# Build step: download the CRITICAL alert beep next to alert_audio.py so the
+# dashboard reads it from disk instead of fetching it at runtime.
+# Run once at deploy time: python fetch_alert_audio.py
+
+if __name__ == "__main__":
+    tmp_path = ALERT_AUDIO_PATH.with_suffix(".part")
+    try:
+        with urllib.request.urlopen(ALERT_AUDIO_URL, timeout=30) as resp, open(tmp_path, "wb") as f:
+            shutil.copyfileobj(resp, f)
+        tmp_path.replace(ALERT_AUDIO_PATH)
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        sys.exit(f"Could not fetch alert audio: {e}")
+    print(f"Saved {ALERT_AUDIO_PATH}")
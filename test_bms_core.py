@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from bms_core import _bin_blocks, compute_degradation
+
+
+def test_bin_blocks_pads_short_string_with_nan():
+    grid = _bin_blocks(np.arange(20.0))
+    assert grid.shape == (6, 5)
+    np.testing.assert_array_equal(grid.ravel()[:20], np.arange(20.0))
+    assert np.isnan(grid.ravel()[20:]).all()
+
+
+def test_bin_blocks_reshapes_full_string():
+    health = np.arange(30.0)
+    np.testing.assert_array_equal(_bin_blocks(health), health.reshape(6, 5))
+
+
+def test_bin_blocks_mean_bins_long_string():
+    health = np.arange(61.0)
+    flat = _bin_blocks(health).ravel()
+    # First 29 tiles average 2 blocks each, the last one averages 3
+    np.testing.assert_allclose(flat[:29], health[:58].reshape(29, 2).mean(axis=1))
+    assert flat[29] == pytest.approx(health[58:].mean())
+
+
+@pytest.mark.parametrize("temp", [19, 20, 40, 25.5])
+def test_compute_degradation(temp):
+    assert compute_degradation(temp) == pytest.approx(1.2 ** (temp - 25))